@@ -14,6 +14,7 @@ from .environment import (
     ENVIRONMENT,
     DATABASE_CONFIG,
     CONCURRENT_FETCHERS,
+    CONCURRENT_SITES,
     FETCH_TIMEOUT,
 )
 
@@ -22,5 +23,6 @@ __all__ = [
     "ENVIRONMENT",
     "DATABASE_CONFIG",
     "CONCURRENT_FETCHERS",
+    "CONCURRENT_SITES",
     "FETCH_TIMEOUT",
 ]
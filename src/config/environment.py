@@ -86,6 +86,7 @@ else:  # development
 
 # Application settings
 CONCURRENT_FETCHERS = _get_int("CONCURRENT_FETCHERS", 3)
+CONCURRENT_SITES = _get_int("CONCURRENT_SITES", 1)
 FETCH_TIMEOUT = _get_int("FETCH_TIMEOUT", 30)
 
 # Scraping limits - Set to None for unlimited articles
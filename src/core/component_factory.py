@@ -4,9 +4,33 @@ Component factory for creating scrapers and parsers from configuration.
 Separates component creation concerns from orchestration logic.
 """
 
+import functools
 import importlib
 
 
+# Class paths are fixed strings from site_configs.py, so each resolves to
+# the same class object for the life of the process. Failures raise and are
+# never cached, so a transient error cannot make a class permanently
+# unimportable.
+@functools.cache
+def _import_class_cached(class_path: str):
+    """Resolve a dotted 'module.Class' path to the class object, memoised."""
+    # One C-level split; an empty separator means there was no dot at all
+    module_path, dot, class_name = class_path.rpartition(".")
+    if not dot:
+        raise ImportError(
+            f"Invalid class path: {class_path}. Expected format: 'module.class'"
+        )
+
+    try:
+        # Always via import_module: it takes the per-module import lock, so a
+        # thread never sees a module another thread is still initialising
+        module = importlib.import_module(module_path)  # loads module into memory
+        return getattr(module, class_name)  # returns class object
+    except (ImportError, AttributeError) as e:
+        raise ImportError(f"Failed to import {class_path}: {e}") from e
+
+
 class ComponentFactory:
     """Factory for creating collectors and validators from configuration dictionaries."""
 
@@ -17,16 +41,12 @@ class ComponentFactory:
 
     @staticmethod
     def import_class(class_path: str):
-        if "." not in class_path:
-            raise ImportError(
-                f"Invalid class path: {class_path}. Expected format: 'module.class'"
-            )
-        module_path, class_name = class_path.rsplit(".", 1)
-        try:
-            module = importlib.import_module(module_path)  # loads module into memory
-            return getattr(module, class_name)  # returns class object
-        except (ImportError, AttributeError) as e:
-            raise ImportError(f"Failed to import {class_path}: {e}") from e
+        return _import_class_cached(class_path)
+
+    @staticmethod
+    def clear_import_cache() -> None:
+        """Forget every resolved class path (e.g. between tests)."""
+        _import_class_cached.cache_clear()
 
     @staticmethod
     def create_component(class_path: str, *args, **kwargs):
@@ -45,6 +65,34 @@ class ComponentFactory:
         component_class = ComponentFactory.import_class(class_path)  # get class
         return component_class(*args, **kwargs)  # Calls constructor (__init__)
 
+    def prewarm(self, site_configs: list[dict]) -> list[str]:
+        """
+        Resolve every collector and validator class path up front.
+
+        When sites are processed on worker threads, importing their modules
+        here, on the calling thread, fills sys.modules and the import cache
+        before those threads start, so they never contend on the import lock.
+        Broken paths are returned rather than raised, leaving process_site's
+        usual per-site handling to report and skip them.
+
+        Args:
+            site_configs: Site configuration dictionaries from site_configs.py
+
+        Returns:
+            Class paths that failed to import
+        """
+        failed = []
+        for config in site_configs:
+            for key in ("url_collector_class", "soup_validator_class"):
+                class_path = config.get(key)
+                if not class_path:
+                    continue
+                try:
+                    self.import_class(class_path)
+                except ImportError:
+                    failed.append(class_path)
+        return failed
+
     def create_collector(self, config: dict):
         """Create url collector from configuration."""
         class_path = config.get("url_collector_class")
@@ -10,16 +10,64 @@ Provides:
 Child soup validators implement domain-specific HTML validation logic.
 """
 
+import functools
+import os
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from config.environment import DEBUG, ENVIRONMENT
 from core.components.web_mixin import WebMixin
 from database.models import RawArticle
+from utils.structured_logger import get_logger
+from utils.url_mapping import URL_MAPPING
+
+# Offline HTML fixtures used when ENVIRONMENT=test
+TEST_HTML_DIR = Path(__file__).parents[4] / "tests" / "fixtures" / "test_html"
+
+# Responses shorter than this are treated as truncated/blocked pages
+MIN_CONTENT_BYTES = 100
+
+# Site name -> fixture directory name under TEST_HTML_DIR
+TEST_SOURCE_DIRS = {
+    "slate.fr": "Slate.fr",
+    "franceinfo.fr": "FranceInfo.fr",
+    "tf1info.fr": "TF1 Info",
+    "ladepeche.fr": "Depeche.fr",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _read_test_sources(source_dir: Path) -> tuple[tuple[str, bytes], ...]:
+    """
+    Read the .html/.php fixtures in one directory, memoised per directory.
+
+    The fixtures are static for the life of the process, so repeated loads of
+    the same site skip the scandir/open/read syscalls. Files are kept as raw
+    bytes so the parser sniffs the encoding itself, exactly as it does for
+    response.content in live mode. Errors propagate and are not cached.
+
+    Args:
+        source_dir: Fixture directory for a single site
+
+    Returns:
+        Tuple of (file name, raw file bytes) pairs
+    """
+    sources = []
+    # Single directory pass: DirEntry carries the name and file type,
+    # so no Path object or extra stat is needed per entry
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith((".html", ".php")):
+                continue
+
+            with open(entry.path, "rb") as f:
+                sources.append((entry.name, f.read()))
+
+    return tuple(sources)
 
 
 class BaseSoupValidator(WebMixin, ABC):
@@ -44,8 +92,6 @@ class BaseSoupValidator(WebMixin, ABC):
             site_name: Human readable source name (e.g., "Slate.fr")
             delay: Request delay in seconds for rate limiting
         """
-        from utils.structured_logger import get_logger
-
         self.logger = get_logger(self.__class__.__name__)
         self.site_domain = site_domain
         self.site_name = site_name
@@ -60,11 +106,12 @@ class BaseSoupValidator(WebMixin, ABC):
 
         for attempt in range(max_retries):
             try:
+                started_at = time.monotonic()
                 response = self.make_request(url, timeout=15)
-                time.sleep(self.delay)
+                self._apply_request_delay(started_at)
                 response.raise_for_status()
 
-                if len(response.content) < 100:
+                if len(response.content) < MIN_CONTENT_BYTES:
                     self.logger.warning(
                         f"Response content too short: {len(response.content)} bytes"
                     )
@@ -83,40 +130,48 @@ class BaseSoupValidator(WebMixin, ABC):
         self.logger.error(f"URL fetch failed after {max_retries} retries")
         return None
 
+    def _apply_request_delay(self, started_at: float) -> None:
+        """
+        Sleep out whatever is left of the rate-limit delay for one request.
+
+        Time spent waiting on the request itself counts towards the delay, so a
+        slow response is not followed by a further full sleep. The deadline is
+        per call, which keeps it correct when fetcher threads share a validator.
+
+        Args:
+            started_at: time.monotonic() taken just before the request was sent
+        """
+        if self.delay <= 0:
+            return
+        remaining = self.delay - (time.monotonic() - started_at)
+        if remaining > 0:
+            time.sleep(remaining)
+
     def get_test_sources_from_directory(
         self, site_name: str
     ) -> list[tuple[BeautifulSoup | None, str]]:
         """Load test HTML files for offline mode testing."""
-        current_file_dir = Path(__file__).parent
-        project_root_dir = current_file_dir.parent.parent.parent.parent
-        test_data_dir = project_root_dir / "tests" / "fixtures" / "test_html"
-
         # Map config source names to directory names
-        source_dir_mapping = {
-            "slate.fr": "Slate.fr",
-            "franceinfo.fr": "FranceInfo.fr",
-            "tf1info.fr": "TF1 Info",
-            "ladepeche.fr": "Depeche.fr",
-        }
-        dir_name = source_dir_mapping.get(site_name, site_name)
-        source_dir = test_data_dir / dir_name
-
-        if not source_dir.exists():
+        dir_name = TEST_SOURCE_DIRS.get(site_name, site_name)
+        source_dir = TEST_HTML_DIR / dir_name
+
+        # A missing directory surfaces from scandir itself, so no separate
+        # exists() stat is needed up front
+        try:
+            sources = _read_test_sources(source_dir)
+        except FileNotFoundError:
             self.logger.warning(f"Test directory not found: {source_dir}")
             return []
+        except Exception as e:
+            self.logger.error(f"Error reading test files: {str(e)}")
+            return []
 
         soup_sources = []
         try:
-            from utils.url_mapping import URL_MAPPING
-
-            for file_path in source_dir.iterdir():
-                if file_path.suffix in (".html", ".php"):
-                    filename = file_path.name
-                    original_url = URL_MAPPING.get(filename, f"test://{filename}")
-
-                    with open(file_path, encoding="utf-8") as f:
-                        soup = self.parse_html_fast(f.read().encode("utf-8"))
-                        soup_sources.append((soup, original_url))
+            for file_name, html in sources:
+                original_url = URL_MAPPING.get(file_name, f"test://{file_name}")
+                soup = self.parse_html_fast(html)
+                soup_sources.append((soup, original_url))
 
         except Exception as e:
             self.logger.error(f"Error reading test files: {str(e)}")
@@ -176,8 +231,6 @@ class BaseSoupValidator(WebMixin, ABC):
         Returns:
             True if title structure is valid, False otherwise
         """
-        from bs4 import Tag
-
         title_tag = soup.find("h1")
         if not title_tag or not isinstance(title_tag, Tag):
             self.logger.warning(
@@ -10,9 +10,24 @@ import time
 import requests
 from bs4 import BeautifulSoup
 
-from core.components.soup_validators.base_soup_validator import BaseSoupValidator
+from config.environment import ENVIRONMENT
+from core.components.soup_validators.base_soup_validator import (
+    MIN_CONTENT_BYTES,
+    BaseSoupValidator,
+)
 from database.models import RawArticle
 
+# Browser-like headers for the anti-bot bypass, built once at import
+TF1_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+    # Don't specify Accept-Encoding to let requests handle compression automatically
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
 
 class Tf1InfoSoupValidator(BaseSoupValidator):
     """
@@ -39,39 +54,27 @@ class Tf1InfoSoupValidator(BaseSoupValidator):
         TF1Info has sophisticated anti-bot protection that returns truncated
         content. Use the same bypass technique as the URL collector.
         """
-        from config.environment import ENVIRONMENT
-
         if ENVIRONMENT == "test":
             self.logger.warning("URL fetch attempted in offline mode")
             return None
 
         for attempt in range(max_retries):
             try:
-                # Create a fresh session for each request to avoid tracking
-                session = requests.Session()
-
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-                    # Don't specify Accept-Encoding to let requests handle compression automatically
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-
                 # Add small delay to mimic human behavior
                 time.sleep(1)
 
-                response = session.get(
-                    url, headers=headers, timeout=15, allow_redirects=True
-                )
+                # Fresh session per request to avoid tracking; closed on exit
+                # even when the request raises
+                with requests.Session() as session:
+                    response = session.get(
+                        url,
+                        headers=TF1_REQUEST_HEADERS,
+                        timeout=15,
+                        allow_redirects=True,
+                    )
                 response.raise_for_status()
 
-                # Close session to avoid tracking
-                session.close()
-
-                if len(response.content) < 100:
+                if len(response.content) < MIN_CONTENT_BYTES:
                     self.logger.warning(
                         f"Response content too short: {len(response.content)} bytes"
                     )
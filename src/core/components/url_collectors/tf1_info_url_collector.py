@@ -3,6 +3,7 @@ TF1 Info UrlCollector - Extracts article URLs from TF1 Info homepage
 """
 
 import json
+import time
 from urllib.parse import urljoin
 
 import requests
@@ -24,8 +25,6 @@ class TF1InfoUrlCollector(BaseUrlCollector):
         TF1Info has sophisticated anti-bot protection that returns truncated
         content. Use a clean session with browser-like behavior.
         """
-        import time
-
         try:
             # Create a fresh session for each request to avoid tracking
             session = requests.Session()
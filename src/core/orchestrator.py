@@ -1,6 +1,12 @@
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 
-from config.environment import CONCURRENT_FETCHERS, DEBUG, FETCH_TIMEOUT, ENVIRONMENT
+from config.environment import (
+    CONCURRENT_FETCHERS,
+    CONCURRENT_SITES,
+    DEBUG,
+    ENVIRONMENT,
+    FETCH_TIMEOUT,
+)
 from config.settings import MIN_SUCCESS_RATE_THRESHOLD
 from core.component_factory import ComponentFactory
 from database.models import SourceStats
@@ -149,11 +155,22 @@ class ArticleOrchestrator:
         ]
 
         # Collect statistics from each source
+        # Sites are independent (own components, own DB sessions), so with
+        # CONCURRENT_SITES > 1 they run on a thread pool; map() keeps results
+        # in config order. The default of 1 processes them sequentially.
         source_stats: list[SourceStats] = []
-        for config in enabled_sites:
-            stats = self.process_site(config)
-            if stats:
-                source_stats.append(stats)
+        if enabled_sites:
+            max_workers = max(1, min(CONCURRENT_SITES, len(enabled_sites)))
+            if max_workers == 1:
+                results = [self.process_site(config) for config in enabled_sites]
+            else:
+                # Import every site's components before the worker threads
+                # start; process_site reports any that fail
+                self.component_factory.prewarm(enabled_sites)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(self.process_site, enabled_sites))
+
+            source_stats = [stats for stats in results if stats]
 
         # Calculate totals
         total_attempted = sum(s.attempted for s in source_stats)
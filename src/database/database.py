@@ -36,6 +36,29 @@ logger = get_logger(__name__)
 _SessionLocal: sessionmaker | None = None
 _engine: Engine | None = None
 
+# Lightweight table constructs, built once so SQLAlchemy's compiled cache hits
+DIM_ARTICLES = table(
+    "dim_articles",
+    column("id"),
+    column("url"),
+    column("site"),
+    column("scraped_at"),
+    column("response_status"),
+)
+
+WORD_FACTS = table(
+    "word_facts",
+    column("id"),
+    column("word"),
+    column("article_id"),
+    column("position_in_article"),
+    column("scraped_at"),
+)
+
+# Executemany insert statements shared by the batch writers
+INSERT_DIM_ARTICLES = DIM_ARTICLES.insert()
+INSERT_WORD_FACTS = WORD_FACTS.insert()
+
 
 def initialize_database(echo: bool | None = None) -> bool:
     """Initialize database connection with optimized connection pooling."""
@@ -184,17 +207,7 @@ def store_article(article: RawArticle) -> bool:
     """
     try:
         with get_session() as session:
-            # Use table() for cleaner insert - public schema only
-            dim_articles_table = table(
-                "dim_articles",
-                column("id"),
-                column("url"),
-                column("site"),
-                column("scraped_at"),
-                column("response_status"),
-            )
-
-            stmt = dim_articles_table.insert().values(
+            stmt = DIM_ARTICLES.insert().values(
                 id=article.id,
                 url=article.url,
                 site=article.site,
@@ -281,21 +294,11 @@ def store_articles_batch(
             # Convert articles to dictionaries for bulk_insert_mappings
             article_dicts = [article.to_dict() for article in articles]
 
-            # Use the dim_articles table metadata for bulk insert
-            dim_articles_table = table(
-                "dim_articles",
-                column("id"),
-                column("url"),
-                column("site"),
-                column("scraped_at"),
-                column("response_status"),
-            )
-
             # Execute bulk insert
             """
             SQL: INSERT INTO dim_articles (columns...) VALUES (...), (...), ...
             """
-            session.execute(dim_articles_table.insert(), article_dicts)
+            session.execute(INSERT_DIM_ARTICLES, article_dicts)
 
             if DEBUG:
                 logger.info(
@@ -360,7 +363,9 @@ def clear_test_database() -> bool:
     """
     Clear all data from test database (TRUNCATE tables).
 
-    Delegates to scripts/sh/clear_tables.sh for consistency with other DB operations.
+    Runs TRUNCATE in-process on an AUTOCOMMIT connection from the pool rather
+    than shelling out to docker exec (scripts/sh/clear_tables.sh still backs
+    `make db-clear`).
     Only works in test environment for safety.
 
     Returns:
@@ -369,47 +374,22 @@ def clear_test_database() -> bool:
     Raises:
         ValueError: If called outside test environment
     """
-    import os
-    import subprocess
-    from pathlib import Path
-
     if ENVIRONMENT != "test":
         raise ValueError(
             f"clear_test_database can only be called in test environment, "
             f"but ENVIRONMENT is '{ENVIRONMENT}'"
         )
 
-    try:
-        # Get database config for test environment
-        db_config = DATABASE_CONFIG
-
-        # Build environment variables for shell script
-        env = os.environ.copy()
-        env.update(
-            {
-                "CONTAINER_NAME": "french_news_test_db",
-                "PGDATABASE": db_config["database"],
-                "PGUSER": db_config["user"],
-            }
-        )
-
-        # Get path to shell script
-        script_path = (
-            Path(__file__).parent.parent.parent / "scripts" / "sh" / "clear_tables.sh"
-        )
-
-        # Execute shell script
-        result = subprocess.run(
-            [str(script_path)],
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+    if _engine is None:
+        logger.error("Failed to clear test database: database not initialized")
+        return False
 
-        if result.returncode != 0:
-            logger.error(f"Failed to clear test database: {result.stderr}")
-            return False
+    try:
+        # Single statement, so no explicit BEGIN/COMMIT pair is needed
+        with _engine.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("TRUNCATE TABLE dim_articles CASCADE")
+            )
 
         if DEBUG:
             logger.info("Successfully cleared test database")
@@ -433,16 +413,7 @@ def store_word_fact(word_fact: WordFact) -> bool:
     """
     try:
         with get_session() as session:
-            word_facts_table = table(
-                "word_facts",
-                column("id"),
-                column("word"),
-                column("article_id"),
-                column("position_in_article"),
-                column("scraped_at"),
-            )
-
-            stmt = word_facts_table.insert().values(
+            stmt = WORD_FACTS.insert().values(
                 id=word_fact.id,
                 word=word_fact.word,
                 article_id=word_fact.article_id,
@@ -480,29 +451,19 @@ def store_word_facts_batch(
     if not word_facts:
         return 0, 0
 
-    # Convert to dictionaries for bulk insert
-    word_fact_dicts = [wf.to_dict() for wf in word_facts]
-
     # Process in batches to avoid memory issues
     successful_count = 0
     failed_count = 0
 
-    for i in range(0, len(word_fact_dicts), batch_size):
-        batch = word_fact_dicts[i : i + batch_size]
+    # Row dicts are built per batch, so only one batch of them is alive at a
+    # time rather than a second full copy of every word in the run
+    for i in range(0, len(word_facts), batch_size):
+        batch = [wf.to_dict() for wf in word_facts[i : i + batch_size]]
 
         try:
             # Each batch gets its own session/transaction
             with get_session() as session:
-                word_facts_table = table(
-                    "word_facts",
-                    column("id"),
-                    column("word"),
-                    column("article_id"),
-                    column("position_in_article"),
-                    column("scraped_at"),
-                )
-
-                session.execute(word_facts_table.insert(), batch)
+                session.execute(INSERT_WORD_FACTS, batch)
                 successful_count += len(batch)
 
                 if DEBUG:
@@ -16,7 +16,7 @@ from uuid import uuid4
 __all__ = ["RawArticle", "WordFact", "SourceStats"]
 
 
-@dataclass
+@dataclass(slots=True)
 class RawArticle:
     """
     Transient container for scraped article data.
@@ -61,13 +61,16 @@ class RawArticle:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WordFact:
     """
     Individual word extracted from an article for vocabulary learning.
 
     Denormalized design: each word gets its own row for vocabulary analysis.
     Links back to source article for context.
+
+    Slotted because one instance is created per word (thousands per article):
+    no per-instance __dict__, so less memory and faster attribute access.
     """
 
     # Required fields
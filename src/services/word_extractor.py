@@ -5,25 +5,37 @@ Extracts individual French words from article HTML and creates
 denormalized WordFact objects for database storage.
 """
 
+import functools
 import re
 
-import trafilatura
-
 from database.models import RawArticle, WordFact
 from utils.structured_logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@functools.cache
+def _trafilatura():
+    """
+    Import trafilatura on first use.
+
+    Its dependency tree costs ~250ms to import, which the orchestrator, CLI
+    startup and test collection shouldn't pay until an article is actually
+    extracted.
+    """
+    import trafilatura
+
+    return trafilatura
+
+
 class WordExtractor:
     """Service for extracting French words from articles."""
 
-    def __init__(self):
-        """Initialize the word extractor."""
-        # Complete French word pattern (all French letters, accents, apostrophes, hyphens)
-        self.french_word_pattern = re.compile(
-            r"\b[a-zA-ZàâäçéèêëïîôöùûüÿñæœÀÂÄÇÉÈÊËÏÎÔÖÙÛÜŸÑÆŒ''-]+\b"
-        )
+    # Complete French word pattern (all French letters, accents, apostrophes, hyphens)
+    # Compiled once at class definition and shared by every instance
+    french_word_pattern = re.compile(
+        r"\b[a-zA-ZàâäçéèêëïîôöùûüÿñæœÀÂÄÇÉÈÊËÏÎÔÖÙÛÜŸÑÆŒ''-]+\b"
+    )
 
     def extract_words_from_article(self, article: RawArticle) -> list[WordFact]:
         """
@@ -37,7 +49,7 @@ class WordExtractor:
         """
         try:
             # Extract text content using trafilatura
-            extracted_text = trafilatura.extract(article.raw_html)
+            extracted_text = _trafilatura().extract(article.raw_html)
 
             if not extracted_text:
                 logger.warning(f"No text extracted from article {article.id}")
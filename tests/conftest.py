@@ -6,21 +6,81 @@ Includes both original test fixtures and automatic ENVIRONMENT=test setup.
 
 import os
 import sys
+from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
-from fixtures.helpers import DummyClass
-
-from core.component_factory import ComponentFactory
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
 
 # Set ENVIRONMENT=test immediately when conftest.py is imported
 os.environ["ENVIRONMENT"] = "test"
 
+# Keep test runs off the disk: no per-run log file or latest.log symlink churn
+# (which xdist workers would race on). Export LOG_TO_FILE=true to opt back in.
+os.environ.setdefault("LOG_TO_FILE", "false")
+
 # Clear any cached environment modules
 modules_to_clear = [mod for mod in sys.modules.keys() if mod.startswith("config")]
 for mod in modules_to_clear:
     del sys.modules[mod]
 
+# Only now import project code, so config loads with ENVIRONMENT=test
+from core.component_factory import ComponentFactory  # noqa: E402
+
+
+# Every E2E statistic as (metric, key, value) rows; built once at import so
+# the statement object is reused rather than re-created per session
+PIPELINE_STATS_SQL = text("""
+    WITH word_totals AS (
+        SELECT
+            COUNT(*) AS words,
+            COUNT(*) FILTER (WHERE da.id IS NULL) AS orphaned,
+            COUNT(*) FILTER (WHERE wf.word = 'le') AS le,
+            COUNT(*) FILTER (WHERE wf.word = 'la') AS la,
+            COUNT(*) FILTER (WHERE wf.word = 'de') AS de,
+            COUNT(*) FILTER (WHERE wf.word = 'et') AS et
+        FROM word_facts wf
+        LEFT JOIN dim_articles da ON wf.article_id = da.id
+    )
+    -- Per-site counts and the overall total from one dim_articles scan
+    SELECT
+        CASE WHEN GROUPING(site) = 1 THEN 'articles' ELSE 'site_articles' END
+            AS metric,
+        site AS key,
+        COUNT(*) AS value
+    FROM dim_articles
+    GROUP BY GROUPING SETS ((site), ())
+    UNION ALL
+    SELECT v.metric, v.key, v.value
+    FROM word_totals t
+    CROSS JOIN LATERAL (
+        VALUES
+            ('words', NULL, t.words),
+            ('orphaned_words', NULL, t.orphaned),
+            ('common_words', 'le', t.le),
+            ('common_words', 'la', t.la),
+            ('common_words', 'de', t.de),
+            ('common_words', 'et', t.et)
+    ) AS v(metric, key, value)
+    UNION ALL
+    SELECT 'article_words', da.url, COUNT(wf.id)
+    FROM dim_articles da
+    LEFT JOIN word_facts wf ON wf.article_id = da.id
+    GROUP BY da.url
+    UNION ALL
+    (
+        SELECT 'top_le_site', da.site, COUNT(*)
+        FROM word_facts wf
+        JOIN dim_articles da ON wf.article_id = da.id
+        WHERE wf.word = 'le'
+        GROUP BY da.site
+        ORDER BY COUNT(*) DESC, da.site
+        LIMIT 1
+    )
+""")
+
 
 @pytest.fixture(autouse=True, scope="session")
 def setup_test_environment():
@@ -44,8 +104,17 @@ def test_database():
     Uses the application's own database initialization and connection management.
     """
     from database.database import initialize_database, get_session
-    from sqlalchemy import text
-    from pathlib import Path
+
+    # Under pytest-xdist each worker gets its own schema so workers never see
+    # each other's rows. PGOPTIONS is read by libpq, so the engine below and
+    # subprocesses such as `make run-test-data` all resolve to that schema.
+    worker_schema = None
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        worker_schema = f"test_{worker}"
+        os.environ["PGOPTIONS"] = (
+            f"{os.environ.get('PGOPTIONS', '')} -c search_path={worker_schema},public"
+        ).strip()
 
     # Initialize database connection
     success = initialize_database()
@@ -54,44 +123,140 @@ def test_database():
     # Apply schema to ensure tables exist
     schema_sql = Path("database/schema.sql").read_text()
     with get_session() as session:
+        if worker_schema:
+            session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {worker_schema}"))
         session.execute(text(schema_sql))
         session.commit()
 
     # Tests will use get_session() from the application
     yield "initialized"
 
+    # Per-worker schemas are disposable; drop them so they don't pile up
+    if worker_schema:
+        with get_session() as session:
+            session.execute(text(f"DROP SCHEMA IF EXISTS {worker_schema} CASCADE"))
+            session.commit()
+
+
+@pytest.fixture
+def db_transaction(test_database, monkeypatch):
+    """
+    Run a test inside a transaction that is rolled back afterwards.
+
+    Every session handed out by get_session() joins one outer transaction
+    through a SAVEPOINT, so application code can commit and roll back as
+    usual while nothing outlives the test. Existing rows are deleted inside
+    the transaction, giving each test an empty view of the tables without
+    the TRUNCATE lock or a round-trip through docker exec.
+    """
+    import database.database as db
+
+    connection = db._engine.connect()
+    outer = connection.begin()
+    connection.execute(text("DELETE FROM dim_articles"))  # cascades to word_facts
+
+    monkeypatch.setattr(
+        db,
+        "_SessionLocal",
+        sessionmaker(bind=connection, join_transaction_mode="create_savepoint"),
+    )
+
+    yield connection
+
+    outer.rollback()
+    connection.close()
+
 
 @pytest.fixture
-def clean_test_db(test_database):
+def db_session(db_transaction):
+    """
+    Session on the db_transaction connection for verification queries.
+
+    Sees everything the code under test wrote without checking out another
+    pooled connection or opening a new get_session() block per query.
     """
-    Clean test database using application's database layer.
+    session = Session(bind=db_transaction, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
 
-    This ensures test isolation by clearing all data using the same
-    database functions that the application uses.
+
+@pytest.fixture(scope="session")
+def pipeline_run(test_database):
+    """
+    Run the test data pipeline once against a freshly cleared database.
+
+    Shared by all E2E tests and run in-process through main(), so the
+    pipeline reuses this interpreter's imports and the already-initialised
+    connection pool instead of paying for `make run-test-data` (make, a new
+    interpreter, imports, a new pool). The CLI path keeps its own smoke test
+    in tests/e2e/test_pipeline_entrypoint.py. Tests using this fixture must
+    treat the database as read-only.
     """
+    import core.orchestrator
     from database.database import clear_test_database
 
-    # Clear database using application's own function
+    # Config is fixed at import time; main() must see the offline test mode
+    assert core.orchestrator.ENVIRONMENT == "test", (
+        "Pipeline modules were imported outside ENVIRONMENT=test"
+    )
+
     success = clear_test_database()
     assert success, "Failed to clear test database"
 
-    # Tests can now use get_session() and other database functions normally
-    yield
+    from main import main
+
+    exit_code = main()
+    assert exit_code == 0, f"Pipeline failed with exit code {exit_code}"
+
+    yield exit_code
+
+
+@pytest.fixture(scope="session")
+def pipeline_stats(pipeline_run):
+    """
+    Collect every statistic the E2E assertions need in a single round-trip.
+
+    One UNION ALL query returns (metric, key, value) rows which are folded
+    into a namespace, so E2E tests are pure assertions with no sessions of
+    their own. The word_facts totals share a single scan via COUNT(*) FILTER.
+    """
+    from database.database import get_session
+
+    with get_session() as session:
+        rows = session.execute(PIPELINE_STATS_SQL).mappings().all()
+
+    grouped: dict[str, dict] = {}
+    for row in rows:
+        grouped.setdefault(row["metric"], {})[row["key"]] = row["value"]
+
+    return SimpleNamespace(
+        article_count=grouped["articles"][None],
+        word_count=grouped["words"][None],
+        orphaned_words=grouped["orphaned_words"][None],
+        site_counts=grouped.get("site_articles", {}),
+        article_word_counts=grouped.get("article_words", {}),
+        common_word_counts=grouped.get("common_words", {}),
+        top_le_site=next(iter(grouped.get("top_le_site", {}).items()), None),
+    )
 
 
 # Component testing fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def factory():
-    """ComponentFactory instance for testing."""
+    """ComponentFactory instance shared by all tests (the factory is stateless)."""
     return ComponentFactory()
 
 
 @pytest.fixture
-def mock_import_class():
+def mock_import_class(monkeypatch):
     """Mock ComponentFactory.import_class to return DummyClass."""
-    with mock.patch.object(ComponentFactory, "import_class") as mock_import:
-        mock_import.return_value = DummyClass
-        yield mock_import
+    # Inline: fixtures.helpers imports application components, which must load
+    # after ENVIRONMENT=test is set above
+    from fixtures.helpers import DummyClass
+
+    mock_import = mock.Mock(return_value=DummyClass)
+    monkeypatch.setattr(ComponentFactory, "import_class", mock_import)
+    return mock_import
 
 
 @pytest.fixture
@@ -7,12 +7,10 @@ Single comprehensive test that runs the full pipeline once and validates:
 - Data integrity is maintained
 """
 
-import subprocess
-
 import pytest
-from sqlalchemy import text
 
-from database.database import get_session
+# All tests share one pipeline run; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("pipeline")
 
 
 # Expected word counts per article (from static fixtures)
@@ -43,7 +41,7 @@ def within_tolerance(actual: int, expected: int, tolerance_pct: float) -> bool:
     return expected - tolerance <= actual <= expected + tolerance
 
 
-def test_complete_word_extraction_pipeline(clean_test_db):
+def test_complete_word_extraction_pipeline(pipeline_stats):
     """
     Test complete pipeline: HTML fixtures → dim_articles + word_facts.
 
@@ -51,110 +49,69 @@ def test_complete_word_extraction_pipeline(clean_test_db):
     """
     print("\n=== E2E: Complete Word Extraction Pipeline ===")
 
-    # Run the pipeline once
-    print("Running pipeline...")
-    result = subprocess.run(
-        ["make", "run-test-data"],
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
-    assert result.returncode == 0, f"Pipeline failed: {result.returncode}"
+    # Pipeline already ran once for the session (pipeline_run fixture)
     print("✓ Pipeline completed successfully")
 
-    with get_session() as session:
-        # 1. Verify articles stored
-        article_count = session.execute(
-            text("SELECT COUNT(*) FROM dim_articles")
-        ).scalar()
-        assert article_count >= 16, f"Expected >= 16 articles, got {article_count}"
-        print(f"✓ Articles stored: {article_count}")
-
-        # 2. Verify total words extracted
-        total_word_count = session.execute(
-            text("SELECT COUNT(*) FROM word_facts")
-        ).scalar()
-        assert total_word_count is not None
-        expected_total = 8082
-        assert within_tolerance(total_word_count, expected_total, 5), (
-            f"Expected ~{expected_total} words (±5%), got {total_word_count}"
-        )
-        print(
-            f"✓ Total words extracted: {total_word_count} (expected: {expected_total} ±5%)"
-        )
+    # 1. Verify articles stored
+    article_count = pipeline_stats.article_count
+    assert article_count >= 16, f"Expected >= 16 articles, got {article_count}"
+    print(f"✓ Articles stored: {article_count}")
+
+    # 2. Verify total words extracted
+    total_word_count = pipeline_stats.word_count
+    assert total_word_count is not None
+    expected_total = 8082
+    assert within_tolerance(total_word_count, expected_total, 5), (
+        f"Expected ~{expected_total} words (±5%), got {total_word_count}"
+    )
+    print(
+        f"✓ Total words extracted: {total_word_count} (expected: {expected_total} ±5%)"
+    )
 
-        # 3. Verify word count per article
-        failed_assertions = []
-        for url_pattern, expected_count, tolerance_pct in EXPECTED_WORD_COUNTS:
-            result = session.execute(
-                text("""
-                    SELECT da.url, COUNT(wf.id) as word_count
-                    FROM dim_articles da
-                    LEFT JOIN word_facts wf ON wf.article_id = da.id
-                    WHERE da.url LIKE :pattern
-                    GROUP BY da.url
-                """),
-                {"pattern": f"%{url_pattern}%"},
-            ).fetchone()
-
-            if result is None:
-                failed_assertions.append(f"Article not found: {url_pattern}")
-                continue
-
-            url, actual_count = result
-
-            if not within_tolerance(actual_count, expected_count, tolerance_pct):
-                tolerance = expected_count * (tolerance_pct / 100.0)
-                min_count = int(expected_count - tolerance)
-                max_count = int(expected_count + tolerance)
-                failed_assertions.append(
-                    f"{url_pattern}: {actual_count} not in range [{min_count}, {max_count}]"
-                )
-
-        if failed_assertions:
-            pytest.fail("\n".join(["Word count mismatches:"] + failed_assertions))
-
-        print(
-            f"✓ All {len(EXPECTED_WORD_COUNTS)} articles have correct word counts (±5%)"
+    # 3. Verify word count per article
+    failed_assertions = []
+    for url_pattern, expected_count, tolerance_pct in EXPECTED_WORD_COUNTS:
+        actual_count = next(
+            (
+                count
+                for url, count in pipeline_stats.article_word_counts.items()
+                if url_pattern in url
+            ),
+            None,
         )
 
-        # 4. Verify French words present (no filtering)
-        french_words = ["le", "la", "de", "et"]
-        for word in french_words:
-            count = session.execute(
-                text("SELECT COUNT(*) FROM word_facts WHERE word = :word"),
-                {"word": word},
-            ).scalar()
-            assert count > 0, f"Common French word '{word}' not found"
-        print(f"✓ French words detected: {french_words}")
-
-        # 5. Verify foreign key integrity
-        orphaned = session.execute(
-            text("""
-                SELECT COUNT(*)
-                FROM word_facts wf
-                LEFT JOIN dim_articles da ON wf.article_id = da.id
-                WHERE da.id IS NULL
-            """)
-        ).scalar()
-        assert orphaned == 0, f"Found {orphaned} orphaned word_facts"
-        print("✓ Foreign key integrity verified")
-
-        # 6. Verify star schema join works
-        result = session.execute(
-            text("""
-                SELECT da.site, wf.word, COUNT(*) as frequency
-                FROM word_facts wf
-                JOIN dim_articles da ON wf.article_id = da.id
-                WHERE wf.word = 'le'
-                GROUP BY da.site, wf.word
-                ORDER BY frequency DESC
-                LIMIT 1
-            """)
-        ).fetchone()
-        assert result is not None, "Star schema join failed"
-        print(
-            f"✓ Star schema join works: {result[0]} has '{result[1]}' {result[2]} times"
-        )
+        if actual_count is None:
+            failed_assertions.append(f"Article not found: {url_pattern}")
+            continue
+
+        if not within_tolerance(actual_count, expected_count, tolerance_pct):
+            tolerance = expected_count * (tolerance_pct / 100.0)
+            min_count = int(expected_count - tolerance)
+            max_count = int(expected_count + tolerance)
+            failed_assertions.append(
+                f"{url_pattern}: {actual_count} not in range [{min_count}, {max_count}]"
+            )
+
+    if failed_assertions:
+        pytest.fail("\n".join(["Word count mismatches:"] + failed_assertions))
+
+    print(f"✓ All {len(EXPECTED_WORD_COUNTS)} articles have correct word counts (±5%)")
+
+    # 4. Verify French words present (no filtering)
+    french_words = ["le", "la", "de", "et"]
+    for word in french_words:
+        count = pipeline_stats.common_word_counts.get(word, 0)
+        assert count > 0, f"Common French word '{word}' not found"
+    print(f"✓ French words detected: {french_words}")
+
+    # 5. Verify foreign key integrity
+    orphaned = pipeline_stats.orphaned_words
+    assert orphaned == 0, f"Found {orphaned} orphaned word_facts"
+    print("✓ Foreign key integrity verified")
+
+    # 6. Verify star schema join works
+    assert pipeline_stats.top_le_site, "Star schema join failed"
+    site, frequency = pipeline_stats.top_le_site
+    print(f"✓ Star schema join works: {site} has 'le' {frequency} times")
 
     print("✓ Complete E2E pipeline test passed")
@@ -0,0 +1,52 @@
+"""
+E2E smoke test for the `make run-test-data` entry point.
+
+The shared pipeline_run fixture calls main() in-process; this test keeps
+the CLI path (make, fresh interpreter, python -m main) covered. It runs
+after the shared pipeline, so a second run must leave the data unchanged.
+Marked slow; skip it with `pytest -m "not slow"`.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from fixtures.helpers import run_capturing
+from sqlalchemy import text
+
+from database.database import get_session
+
+# All tests share one pipeline run; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("pipeline")
+
+
+@pytest.mark.slow
+def test_run_test_data_entrypoint_is_idempotent(pipeline_stats):
+    """Test `make run-test-data` succeeds and re-running adds no duplicates."""
+    # Fail fast rather than waiting out the timeout when tooling is missing
+    if shutil.which("make") is None or not Path("venv/bin/python").exists():
+        pytest.skip("make or ./venv/bin/python not available for run-test-data")
+
+    timeout = int(os.getenv("PIPELINE_RUN_TIMEOUT", "60"))
+    try:
+        # Output is drained while the pipeline runs; only its tail is kept
+        result = run_capturing(["make", "run-test-data"], timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        pytest.fail(
+            f"run-test-data did not finish within {timeout}s "
+            f"(set PIPELINE_RUN_TIMEOUT to raise the limit)\n"
+            f"--- stdout ---\n{e.output}\n--- stderr ---\n{e.stderr}"
+        )
+    assert result.returncode == 0, f"Pipeline failed: {result.stderr}"
+
+    with get_session() as session:
+        article_count = session.execute(
+            text("SELECT COUNT(*) FROM dim_articles")
+        ).scalar()
+
+    assert article_count == pipeline_stats.article_count, (
+        f"Re-running the pipeline changed article count: "
+        f"{pipeline_stats.article_count} -> {article_count}"
+    )
@@ -1,3 +1,17 @@
+import os
+import selectors
+import signal
+import subprocess
+import time
+from collections import deque
+from pathlib import Path
+from types import SimpleNamespace
+
+import requests
+
+from core.components.soup_validators.base_soup_validator import BaseSoupValidator
+
+
 class DummyClass:
     """
     A dummy class for testing purposes on component_factory.py
@@ -10,3 +24,165 @@ class DummyClass:
         self.kwargs = kwargs
 
     pass
+
+
+def fake_response(content=b"", status_code=200):
+    """
+    Minimal stand-in for a requests.Response.
+
+    A SimpleNamespace avoids Mock's attribute machinery for tests that only
+    read content/status and call raise_for_status(); keep Mock for tests that
+    need side_effect or call assertions.
+
+    Args:
+        content: Response body bytes
+        status_code: HTTP status code; 400 and above make raise_for_status()
+            raise requests.HTTPError
+
+    Returns:
+        SimpleNamespace with content, status_code and raise_for_status
+    """
+
+    def raise_for_status():
+        if status_code >= 400:
+            raise requests.HTTPError(f"{status_code} Error")
+
+    return SimpleNamespace(
+        content=content, status_code=status_code, raise_for_status=raise_for_status
+    )
+
+
+def html_fixtures_by_source(root):
+    """
+    Group .html/.php fixture files by source directory in a single walk.
+
+    Args:
+        root: Directory holding one sub-directory of fixtures per source
+
+    Returns:
+        Dict mapping source directory name to its sorted fixture paths
+    """
+    grouped = {}
+    for dirpath, _, filenames in os.walk(root):
+        fixtures = sorted(
+            name for name in filenames if name.endswith((".html", ".php"))
+        )
+        if fixtures:
+            parent = Path(dirpath)
+            grouped[parent.name] = [parent / name for name in fixtures]
+    return grouped
+
+
+class MockSoupValidator(BaseSoupValidator):
+    """Concrete BaseSoupValidator for testing the abstract base class."""
+
+    def validate_and_extract(self, soup, url):
+        return None
+
+
+def _kill_group(proc):
+    """SIGKILL a child's whole process group, reap it and close its pipes."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # Group already gone
+    proc.wait()
+    proc.stdout.close()
+    proc.stderr.close()
+
+
+def _decode_tail(lines):
+    """Join retained output lines back into text."""
+    return "\n".join(line.decode("utf-8", "replace") for line in lines)
+
+
+def run_capturing(cmd, cwd=None, timeout=None, tail_lines=256):
+    """
+    Run a command, draining stdout/stderr as they are produced.
+
+    Unlike subprocess.run(capture_output=True) the pipes are read while the
+    child runs, so a chatty process never stalls on a full pipe buffer and
+    only the last `tail_lines` lines of each stream are kept in memory.
+
+    Args:
+        cmd: Command and arguments to execute
+        cwd: Working directory for the child process
+        timeout: Seconds before the child's process group is killed, None for
+            no limit
+        tail_lines: Number of trailing lines kept per stream
+
+    Returns:
+        CompletedProcess whose stdout/stderr hold the retained tail
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds `timeout`; its
+            output/stderr hold the tail captured up to that point
+    """
+    # Own process group, so a timeout kills make *and* the interpreter it runs
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+    tails = {
+        proc.stdout: deque(maxlen=tail_lines),
+        proc.stderr: deque(maxlen=tail_lines),
+    }
+    partial = {proc.stdout: b"", proc.stderr: b""}
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def _timed_out():
+        return subprocess.TimeoutExpired(
+            cmd,
+            timeout,
+            output=_decode_tail(tails[proc.stdout]),
+            stderr=_decode_tail(tails[proc.stderr]),
+        )
+
+    # start_new_session means Ctrl+C never reaches the child, so every way out
+    # of here (timeout, KeyboardInterrupt, OSError, ...) must kill the group
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ)
+            selector.register(proc.stderr, selectors.EVENT_READ)
+
+            while selector.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise _timed_out()
+
+                for key, _ in selector.select(remaining):
+                    stream = key.fileobj
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(stream)
+                        if partial[stream]:
+                            tails[stream].append(partial[stream])
+                        continue
+                    *lines, partial[stream] = (partial[stream] + chunk).split(b"\n")
+                    tails[stream].extend(lines)
+
+        # Both pipes are closed, but the child may still be running (e.g. it
+        # closed its output early); the deadline applies here too
+        try:
+            returncode = proc.wait(
+                timeout=None
+                if deadline is None
+                else max(deadline - time.monotonic(), 0)
+            )
+        except subprocess.TimeoutExpired:
+            raise _timed_out() from None
+    except BaseException:
+        _kill_group(proc)
+        raise
+    proc.stdout.close()
+    proc.stderr.close()
+
+    return subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        _decode_tail(tails[proc.stdout]),
+        _decode_tail(tails[proc.stderr]),
+    )
@@ -5,13 +5,14 @@ These tests use the application's own database functions and connection
 management for proper integration testing.
 """
 
+import pytest
 from sqlalchemy import text
 
-from database.database import store_articles_batch, store_article, get_session
+from database.database import store_articles_batch, store_article
 from database.models import RawArticle
 
 
-def test_store_single_article(clean_test_db):
+def test_store_single_article(db_session):
     """Test storing a single article (metadata only, no HTML)."""
     article = RawArticle(
         url="https://slate.fr/test-article",
@@ -24,61 +25,60 @@ def test_store_single_article(clean_test_db):
     assert result
 
     # Verify metadata stored in dim_articles (no raw_html)
-    with get_session() as session:
-        row = session.execute(
-            text("""
-            SELECT url, site
-            FROM dim_articles
-            WHERE id = :id
-        """),
-            {"id": article.id},
-        ).fetchone()
-
-        assert row is not None
-        assert row[0] == article.url
-        assert row[1] == article.site
-        # raw_html is NOT stored in dim_articles
-
-
-def test_store_batch_articles(clean_test_db):
-    """Test storing multiple articles in batch (metadata only)."""
+    row = db_session.execute(
+        text("""
+        SELECT url, site
+        FROM dim_articles
+        WHERE id = :id
+    """),
+        {"id": article.id},
+    ).fetchone()
+
+    assert row is not None
+    assert row[0] == article.url
+    assert row[1] == article.site
+    # raw_html is NOT stored in dim_articles
+
+
+@pytest.mark.parametrize("n_articles", [1, 3, 50])
+def test_store_batch_articles(db_session, n_articles):
+    """Test storing multiple articles in one batch insert (metadata only)."""
     articles = [
         RawArticle(
             url=f"https://franceinfo.fr/article-{i}",
             raw_html=f"<html><h1>News {i}</h1><p>Content {i}</p></html>",
             site="franceinfo.fr",
         )
-        for i in range(3)
+        for i in range(n_articles)
     ]
 
     # Store using application's database function
     successful, failed = store_articles_batch(articles)
-    assert successful == 3
+    assert successful == n_articles
     assert failed == 0
 
     # Verify all in database
-    with get_session() as session:
-        count = session.execute(text("SELECT COUNT(*) FROM dim_articles")).fetchone()[0]
-        assert count == 3
-
-        # Check each article metadata
-        for article in articles:
-            row = session.execute(
-                text("""
-                SELECT url, site
-                FROM dim_articles
-                WHERE id = :id
-            """),
-                {"id": article.id},
-            ).fetchone()
-
-            assert row is not None
-            assert row[0] == article.url
-            assert row[1] == article.site
-            # raw_html is NOT stored
-
-
-def test_duplicate_urls_rejected(clean_test_db):
+    count = db_session.execute(text("SELECT COUNT(*) FROM dim_articles")).fetchone()[0]
+    assert count == n_articles
+
+    # Check each article metadata
+    for article in articles:
+        row = db_session.execute(
+            text("""
+            SELECT url, site
+            FROM dim_articles
+            WHERE id = :id
+        """),
+            {"id": article.id},
+        ).fetchone()
+
+        assert row is not None
+        assert row[0] == article.url
+        assert row[1] == article.site
+        # raw_html is NOT stored
+
+
+def test_duplicate_urls_rejected(db_session):
     """Test that duplicate URLs are rejected by UNIQUE constraint."""
     article1 = RawArticle(
         url="https://lemonde.fr/same-story",
@@ -98,15 +98,14 @@ def test_duplicate_urls_rejected(clean_test_db):
     assert not store_article(article2)
 
     # Verify only one article stored
-    with get_session() as session:
-        rows = session.execute(
-            text("""
-            SELECT id, url
-            FROM dim_articles
-            WHERE url = :url
-        """),
-            {"url": "https://lemonde.fr/same-story"},
-        ).fetchall()
-
-        assert len(rows) == 1
-        assert rows[0][1] == "https://lemonde.fr/same-story"
+    rows = db_session.execute(
+        text("""
+        SELECT id, url
+        FROM dim_articles
+        WHERE url = :url
+    """),
+        {"url": "https://lemonde.fr/same-story"},
+    ).fetchall()
+
+    assert len(rows) == 1
+    assert rows[0][1] == "https://lemonde.fr/same-story"
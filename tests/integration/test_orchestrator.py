@@ -2,16 +2,21 @@
 Simple integration tests for ArticleOrchestrator.
 """
 
+import os
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
+from config.environment import CONCURRENT_SITES
 from core.orchestrator import ArticleOrchestrator
 from database.models import RawArticle, SourceStats
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def orchestrator():
-    """Create orchestrator instance for testing."""
+    """Create orchestrator instance shared by this module (patches are per test)."""
     return ArticleOrchestrator()
 
 
@@ -213,6 +218,53 @@ class TestArticleOrchestrator:
             )
             assert mock_process.call_count == 2  # Only enabled sites
 
+    @pytest.mark.skipif(
+        "CONCURRENT_SITES" in os.environ,
+        reason="CONCURRENT_SITES is overridden in the environment",
+    )
+    def test_concurrent_sites_defaults_to_single_worker(self):
+        """Test concurrent site processing is opt-in."""
+        assert CONCURRENT_SITES == 1
+
+    @patch("core.orchestrator.CONCURRENT_SITES", 1)
+    def test_process_all_sites_sequential_when_single_worker(self, orchestrator):
+        """Test CONCURRENT_SITES=1 processes sites one by one on the caller's thread."""
+        site_configs = [{"site": f"site{i}.fr", "enabled": True} for i in range(3)]
+        calls = []
+
+        def process_site(config):
+            calls.append((config["site"], threading.get_ident()))
+            return SourceStats(config["site"], 1, 1, 0, 10, [10])
+
+        with patch.object(orchestrator, "process_site", side_effect=process_site):
+            orchestrator.process_all_sites(site_configs)
+
+        assert [site for site, _ in calls] == [c["site"] for c in site_configs]
+        assert {thread for _, thread in calls} == {threading.get_ident()}
+
+    @patch("core.orchestrator.CONCURRENT_SITES", 3)
+    def test_process_all_sites_concurrent_keeps_config_order(self, orchestrator):
+        """Test concurrent sites report stats in config order, not completion order."""
+        site_configs = [{"site": f"site{i}.fr", "enabled": True} for i in range(3)]
+        # Earlier sites finish last, reversing completion order
+        finish_delay = {"site0.fr": 0.06, "site1.fr": 0.04, "site2.fr": 0.02}
+        # All three must be running at once to pass the barrier
+        all_running = threading.Barrier(len(site_configs), timeout=5)
+
+        def process_site(config):
+            all_running.wait()
+            time.sleep(finish_delay[config["site"]])
+            return SourceStats(config["site"], 1, 1, 0, 10, [10])
+
+        with (
+            patch.object(orchestrator, "process_site", side_effect=process_site),
+            patch("core.orchestrator.visual_source_summary") as mock_summary,
+        ):
+            orchestrator.process_all_sites(site_configs)
+
+        reported = mock_summary.call_args.args[0]
+        assert [s.site_name for s in reported] == [c["site"] for c in site_configs]
+
     def test_process_all_sites_empty_list(self, orchestrator):
         """Test processing empty site list."""
         orchestrator.process_all_sites([])
@@ -7,12 +7,12 @@ This is faster than E2E tests and provides quick feedback on word extraction log
 
 from sqlalchemy import text
 
-from database.database import store_article, store_word_facts_batch, get_session
+from database.database import store_article, store_word_facts_batch
 from database.models import RawArticle
 from services.word_extractor import WordExtractor
 
 
-def test_word_extraction_and_storage_flow(clean_test_db):
+def test_word_extraction_and_storage_flow(db_session):
     """Test complete flow: RawArticle → WordExtractor → WordFacts → Database."""
     # 1. Create sample article with French content
     article = RawArticle(
@@ -48,47 +48,46 @@ def test_word_extraction_and_storage_flow(clean_test_db):
     assert failed == 0, f"Expected 0 failed, got {failed}"
 
     # 5. Verify in database using SQL queries
-    with get_session() as session:
-        # Check word count for this article
-        count = session.execute(
-            text("SELECT COUNT(*) FROM word_facts WHERE article_id = :id"),
-            {"id": article.id},
-        ).scalar()
-        assert count == 6, f"Expected 6 words in database, got {count}"
-
-        # Verify specific words exist
-        for expected_word in ["le", "chat", "pomme"]:
-            word_count = session.execute(
-                text(
-                    """
-                    SELECT COUNT(*) FROM word_facts
-                    WHERE article_id = :id AND word = :word
-                """
-                ),
-                {"id": article.id, "word": expected_word},
-            ).scalar()
-            assert word_count == 1, f"Word '{expected_word}' not found in database"
-
-        # Verify star schema join works
-        result = session.execute(
+    # Check word count for this article
+    count = db_session.execute(
+        text("SELECT COUNT(*) FROM word_facts WHERE article_id = :id"),
+        {"id": article.id},
+    ).scalar()
+    assert count == 6, f"Expected 6 words in database, got {count}"
+
+    # Verify specific words exist
+    for expected_word in ["le", "chat", "pomme"]:
+        word_count = db_session.execute(
             text(
                 """
-                SELECT da.url, wf.word, wf.position_in_article
-                FROM word_facts wf
-                JOIN dim_articles da ON wf.article_id = da.id
-                WHERE da.id = :id
-                ORDER BY wf.position_in_article
+                SELECT COUNT(*) FROM word_facts
+                WHERE article_id = :id AND word = :word
             """
             ),
-            {"id": article.id},
-        ).fetchall()
-
-        assert len(result) == 6, "Star schema join returned wrong count"
-        assert result[0][1] == "le", "First word should be 'le'"
-        assert result[5][1] == "rouge", "Last word should be 'rouge'"
-
+            {"id": article.id, "word": expected_word},
+        ).scalar()
+        assert word_count == 1, f"Word '{expected_word}' not found in database"
 
-def test_word_extraction_with_complex_html(clean_test_db):
+    # Verify star schema join works
+    result = db_session.execute(
+        text(
+            """
+            SELECT da.url, wf.word, wf.position_in_article
+            FROM word_facts wf
+            JOIN dim_articles da ON wf.article_id = da.id
+            WHERE da.id = :id
+            ORDER BY wf.position_in_article
+        """
+        ),
+        {"id": article.id},
+    ).fetchall()
+
+    assert len(result) == 6, "Star schema join returned wrong count"
+    assert result[0][1] == "le", "First word should be 'le'"
+    assert result[5][1] == "rouge", "Last word should be 'rouge'"
+
+
+def test_word_extraction_with_complex_html(db_session):
     """Test word extraction handles complex HTML with multiple paragraphs."""
     # Article with multiple paragraphs and mixed content
     article = RawArticle(
@@ -122,21 +121,20 @@ def test_word_extraction_with_complex_html(clean_test_db):
     assert stored == len(word_facts)
     assert failed == 0
 
-    with get_session() as session:
-        # Verify all words are linked to correct article
-        orphaned = session.execute(
-            text(
-                """
-                SELECT COUNT(*) FROM word_facts
-                WHERE article_id = :id AND scraped_at IS NULL
+    # Verify all words are linked to correct article
+    orphaned = db_session.execute(
+        text(
             """
-            ),
-            {"id": article.id},
-        ).scalar()
-        assert orphaned == 0, "All word_facts should have scraped_at timestamp"
+            SELECT COUNT(*) FROM word_facts
+            WHERE article_id = :id AND scraped_at IS NULL
+        """
+        ),
+        {"id": article.id},
+    ).scalar()
+    assert orphaned == 0, "All word_facts should have scraped_at timestamp"
 
 
-def test_word_extraction_empty_content(clean_test_db):
+def test_word_extraction_empty_content(db_transaction):
     """Test word extraction handles HTML with no extractable text."""
     # Article with only images/scripts, no readable text
     article = RawArticle(
@@ -160,7 +158,7 @@ def test_word_extraction_empty_content(clean_test_db):
     assert failed == 0
 
 
-def test_word_extraction_preserves_french_characters(clean_test_db):
+def test_word_extraction_preserves_french_characters(db_session):
     """Test that French accented characters are preserved in word extraction."""
     article = RawArticle(
         url="https://test.fr/accents",
@@ -187,10 +185,9 @@ def test_word_extraction_preserves_french_characters(clean_test_db):
     assert failed == 0
 
     # Verify in database
-    with get_session() as session:
-        for word in ["élève", "français", "étudie"]:
-            count = session.execute(
-                text("SELECT COUNT(*) FROM word_facts WHERE word = :word"),
-                {"word": word},
-            ).scalar()
-            assert count > 0, f"Accented word '{word}' should be in database"
+    for word in ["élève", "français", "étudie"]:
+        count = db_session.execute(
+            text("SELECT COUNT(*) FROM word_facts WHERE word = :word"),
+            {"word": word},
+        ).scalar()
+        assert count > 0, f"Accented word '{word}' should be in database"
@@ -1,7 +1,16 @@
 import pytest
+from fixtures import helpers
 from fixtures.helpers import DummyClass
 
-from core.component_factory import ComponentFactory
+from config.site_configs import get_site_configs
+from core.component_factory import ComponentFactory, _import_class_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_import_cache():
+    """Reset the process-wide class cache so test order cannot leak state."""
+    yield
+    ComponentFactory.clear_import_cache()
 
 
 def test_import_class_happy():
@@ -10,6 +19,26 @@ def test_import_class_happy():
     assert imported_class is DummyClass
 
 
+def test_import_class_cached():
+    class_path = "fixtures.helpers.DummyClass"
+    first = ComponentFactory.import_class(class_path)
+    hits_before = _import_class_cached.cache_info().hits
+
+    assert ComponentFactory.import_class(class_path) is first
+    assert _import_class_cached.cache_info().hits == hits_before + 1
+
+
+def test_import_class_failure_not_cached(monkeypatch):
+    class_path = "fixtures.helpers.LateClass"
+    with pytest.raises(ImportError, match="Failed to import"):
+        ComponentFactory.import_class(class_path)
+
+    # Once the attribute exists the same path resolves: failures aren't kept
+    monkeypatch.setattr(helpers, "LateClass", DummyClass, raising=False)
+
+    assert ComponentFactory.import_class(class_path) is DummyClass
+
+
 def test_import_class_not_full_path():
     incorrect_path = "notFullClassPath"
     with pytest.raises(ImportError, match="Invalid class path"):
@@ -28,6 +57,28 @@ def test_create_component_invalid_class_path():
         ComponentFactory.create_component(invalid_path)
 
 
+def test_prewarm_resolves_config_classes(factory):
+    configs = [
+        {
+            "site": "good.fr",
+            "url_collector_class": "fixtures.helpers.DummyClass",
+            "soup_validator_class": "fixtures.helpers.DummyClass",
+        },
+        {
+            "site": "broken.fr",
+            "url_collector_class": "fixtures.helpers.DummyClass",
+            "soup_validator_class": "fixtures.helpers.MissingValidator",
+        },
+    ]
+
+    failed = factory.prewarm(configs)
+
+    assert failed == ["fixtures.helpers.MissingValidator"]
+    hits_before = _import_class_cached.cache_info().hits
+    assert ComponentFactory.import_class("fixtures.helpers.DummyClass") is DummyClass
+    assert _import_class_cached.cache_info().hits == hits_before + 1
+
+
 def test_create_collector_happy(factory, collector_config, mock_import_class):
     result = factory.create_collector(collector_config)
     assert isinstance(result, DummyClass)
@@ -46,3 +97,39 @@ def test_create_validator_happy(factory, collector_config, mock_import_class):
 def test_create_validator_invalid_config(factory, mock_import_class):
     with pytest.raises(ValueError, match="No soup_validator_class specified"):
         factory.create_validator({"site": None})
+
+
+# Loaded at collection time so each config and class path is its own case
+SITE_CONFIGS = get_site_configs()
+
+REQUIRED_CONFIG_KEYS = {
+    "site",
+    "enabled",
+    "url_collector_class",
+    "soup_validator_class",
+    "url_collector_kwargs",
+    "soup_validator_kwargs",
+}
+
+
+def test_site_configs_not_empty():
+    assert isinstance(SITE_CONFIGS, list) and SITE_CONFIGS
+
+
+@pytest.mark.parametrize("config", SITE_CONFIGS, ids=lambda c: c.get("site"))
+def test_site_config_has_required_keys(config):
+    missing = REQUIRED_CONFIG_KEYS - config.keys()
+    assert not missing, f"{config.get('site')}: missing keys {sorted(missing)}"
+
+
+@pytest.mark.parametrize(
+    "class_path",
+    [
+        pytest.param(config[key], id=f"{config['site']}-{key}")
+        for config in SITE_CONFIGS
+        for key in ("url_collector_class", "soup_validator_class")
+    ],
+)
+def test_site_config_classes_importable(class_path):
+    imported_class = ComponentFactory.import_class(class_path)
+    assert imported_class.__name__ == class_path.rpartition(".")[2]
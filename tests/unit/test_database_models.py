@@ -38,29 +38,16 @@ def test_initialization_with_required_fields(sample_html):
     assert article.scraped_at is not None
 
 
+@pytest.mark.parametrize("bad_value", [None, ""], ids=["missing", "empty"])
 @pytest.mark.parametrize("missing_field", ["url", "raw_html", "site"])
-def test_initialization_missing_required_fields(missing_field, sample_html):
-    """Test that missing required fields raise ValueError."""
+def test_initialization_missing_required_fields(missing_field, bad_value, sample_html):
+    """Test that missing or empty required fields raise ValueError."""
     fields = {
         "url": "https://test.com/article",
         "raw_html": sample_html,
         "site": "test.com",
     }
-    fields[missing_field] = None
-
-    with pytest.raises(ValueError, match="url, raw_html, and site are required"):
-        RawArticle(**fields)
-
-
-@pytest.mark.parametrize("missing_field", ["url", "raw_html", "site"])
-def test_initialization_empty_required_fields(missing_field, sample_html):
-    """Test that empty required fields raise ValueError."""
-    fields = {
-        "url": "https://test.com/article",
-        "raw_html": sample_html,
-        "site": "test.com",
-    }
-    fields[missing_field] = ""
+    fields[missing_field] = bad_value
 
     with pytest.raises(ValueError, match="url, raw_html, and site are required"):
         RawArticle(**fields)
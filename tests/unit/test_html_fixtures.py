@@ -0,0 +1,33 @@
+"""
+Sanity checks on the offline HTML fixtures used by ENVIRONMENT=test runs.
+"""
+
+import pytest
+from fixtures.helpers import html_fixtures_by_source
+
+from core.components.soup_validators.base_soup_validator import TEST_HTML_DIR
+
+EXPECTED_FILES = {
+    "Slate.fr": 4,
+    "FranceInfo.fr": 4,
+    "TF1 Info": 4,
+    "Depeche.fr": 4,
+}
+
+
+@pytest.fixture(scope="module")
+def fixtures_by_source():
+    """Fixture files grouped by source, discovered once for the module."""
+    return html_fixtures_by_source(TEST_HTML_DIR)
+
+
+@pytest.mark.parametrize("source_name,expected_count", list(EXPECTED_FILES.items()))
+def test_html_file_count_per_source(fixtures_by_source, source_name, expected_count):
+    """Each source directory holds the expected number of fixtures."""
+    assert len(fixtures_by_source.get(source_name, [])) == expected_count
+
+
+def test_total_html_file_count(fixtures_by_source):
+    """Total fixture count matches the 16 articles the E2E tests expect."""
+    total = sum(len(paths) for paths in fixtures_by_source.values())
+    assert total == sum(EXPECTED_FILES.values())
@@ -4,39 +4,39 @@ Essential unit tests for BaseSoupValidator.
 Tests core behavior without overcomplexity.
 """
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
+import requests
 from bs4 import BeautifulSoup
+from fixtures.helpers import MockSoupValidator, fake_response
 
 from core.components.soup_validators.base_soup_validator import BaseSoupValidator
 
+# Test documents encoded once at import, as fetched/fixture bytes would arrive
+HTML_WITH_H1 = b"<html><body><h1>Test Title</h1><p>Content</p></body></html>"
+HTML_WITHOUT_H1 = b"<html><body><p>Content only</p></body></html>"
+HTML_FETCHED = b"<html><body><h1>Test</h1></body></html>" + b"x" * 100  # > 100 bytes
+HTML_FRENCH = "<html><body><h1>Café</h1></body></html>".encode()
+HTML_FIXTURE = b"<html><body><h1>Test</h1></body></html>"
 
-class MockSoupValidator(BaseSoupValidator):
-    """Concrete implementation for testing abstract base class."""
 
-    def validate_and_extract(self, soup, url):
-        return None
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
-    """Create a validator instance for testing."""
+    """Validator shared by this module; tests only monkeypatch it per test."""
     return MockSoupValidator("test.com", "Test Site", 1.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def soup_with_h1():
-    """BeautifulSoup object with h1 tag."""
-    html = "<html><body><h1>Test Title</h1><p>Content</p></body></html>"
-    return BeautifulSoup(html, "html.parser")
+    """BeautifulSoup object with h1 tag, parsed once and only read by tests."""
+    return BeautifulSoup(HTML_WITH_H1, "lxml")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def soup_without_h1():
-    """BeautifulSoup object without h1 tag."""
-    html = "<html><body><p>Content only</p></body></html>"
-    return BeautifulSoup(html, "html.parser")
+    """BeautifulSoup object without h1 tag, parsed once and only read by tests."""
+    return BeautifulSoup(HTML_WITHOUT_H1, "lxml")
 
 
 def test_initialization(validator):
@@ -115,20 +115,74 @@ def test_url_fetch_successful(validator, monkeypatch):
         "core.components.soup_validators.base_soup_validator.ENVIRONMENT", "development"
     )
 
-    html = "<html><body><h1>Test</h1></body></html>" + "x" * 100  # Long enough content
-    mock_response = Mock()
-    mock_response.content = html.encode("utf-8")
-    mock_response.raise_for_status.return_value = None
+    mock_response = fake_response(HTML_FETCHED)
 
     monkeypatch.setattr(validator, "make_request", lambda url, timeout: mock_response)
-    monkeypatch.setattr(
-        validator, "parse_html_fast", lambda content: BeautifulSoup(html, "html.parser")
-    )
+    monkeypatch.setattr(validator, "delay", 0.0)
 
+    # Parsed by the production lxml path straight from response.content bytes
     result = validator.get_soup_from_url("https://test.com/article")
 
     assert result is not None
     assert isinstance(result, BeautifulSoup)
+    assert result.find("h1").get_text() == "Test"
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [
+        requests.ConnectionError("network down"),
+        requests.Timeout("timed out"),
+        fake_response(b"x" * 200, status_code=404),
+    ],
+    ids=["connection_error", "timeout", "http_error"],
+)
+def test_url_fetch_errors_return_none(validator, monkeypatch, outcome):
+    """Test every fetch failure is retried, then reported as None."""
+    monkeypatch.setattr(
+        "core.components.soup_validators.base_soup_validator.ENVIRONMENT", "development"
+    )
+    monkeypatch.setattr(
+        "core.components.soup_validators.base_soup_validator.time.sleep",
+        lambda seconds: None,
+    )
+    calls = []
+
+    def failing_request(url, timeout):
+        calls.append(url)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(validator, "make_request", failing_request)
+
+    result = validator.get_soup_from_url("https://test.com/article", max_retries=3)
+
+    assert result is None
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "delay,started_at,expected_sleeps",
+    [
+        (0.0, 100.0, []),  # Disabled
+        (1.5, 100.0, [1.5]),  # Instant response: full delay
+        (1.5, 99.0, [0.5]),  # Request took 1s: only the remainder
+        (1.5, 98.0, []),  # Request outlasted the delay: no sleep
+    ],
+)
+def test_request_delay(validator, monkeypatch, delay, started_at, expected_sleeps):
+    """Test rate-limit sleep only covers the part of the delay still left."""
+    sleeps = []
+    monkeypatch.setattr(
+        "core.components.soup_validators.base_soup_validator.time",
+        SimpleNamespace(monotonic=lambda: 100.0, sleep=sleeps.append),
+    )
+    monkeypatch.setattr(validator, "delay", delay)
+
+    validator._apply_request_delay(started_at)
+
+    assert sleeps == expected_sleeps
 
 
 def test_directory_loading_nonexistent(validator, monkeypatch):
@@ -144,38 +198,19 @@ def test_directory_loading_nonexistent(validator, monkeypatch):
     assert len(warning_calls) == 1
 
 
-def test_directory_loading_valid_files(validator, monkeypatch):
+def test_directory_loading_valid_files(validator, monkeypatch, tmp_path):
     """Test loading test sources from existing directory."""
-    mock_file = Mock()
-    mock_file.suffix = ".html"
-    mock_file.name = "test.html"
-
-    html = "<html><body><h1>Test</h1></body></html>"
+    source_dir = tmp_path / "Slate.fr"
+    source_dir.mkdir()
+    (source_dir / "test.html").write_bytes(HTML_FRENCH)
+    (source_dir / "notes.txt").write_text("not a fixture", encoding="utf-8")
 
-    # Mock path operations
-    monkeypatch.setattr("pathlib.Path.exists", lambda self: True)
-    monkeypatch.setattr("pathlib.Path.iterdir", lambda self: [mock_file])
     monkeypatch.setattr(
-        "utils.url_mapping.URL_MAPPING", {"test.html": "https://test.com/article"}
+        "core.components.soup_validators.base_soup_validator.TEST_HTML_DIR", tmp_path
     )
-
-    # Mock file reading
-    def mock_open(*args, **kwargs):
-        class MockFile:
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def read(self):
-                return html
-
-        return MockFile()
-
-    monkeypatch.setattr("builtins.open", mock_open)
     monkeypatch.setattr(
-        validator, "parse_html_fast", lambda content: BeautifulSoup(html, "html.parser")
+        "core.components.soup_validators.base_soup_validator.URL_MAPPING",
+        {"test.html": "https://test.com/article"},
     )
 
     result = validator.get_test_sources_from_directory("slate.fr")
@@ -183,9 +218,27 @@ def test_directory_loading_valid_files(validator, monkeypatch):
     assert len(result) == 1
     soup, url = result[0]
     assert isinstance(soup, BeautifulSoup)
+    assert soup.find("h1").get_text() == "Café"  # Decoded by the parser from bytes
     assert url == "https://test.com/article"
 
 
+def test_directory_loading_reads_each_directory_once(validator, monkeypatch, tmp_path):
+    """Test repeated loads of one site reuse the cached fixture contents."""
+    source_dir = tmp_path / "Slate.fr"
+    source_dir.mkdir()
+    (source_dir / "test.html").write_bytes(HTML_FIXTURE)
+    monkeypatch.setattr(
+        "core.components.soup_validators.base_soup_validator.TEST_HTML_DIR", tmp_path
+    )
+
+    first = validator.get_test_sources_from_directory("slate.fr")
+    (source_dir / "test.html").unlink()
+    second = validator.get_test_sources_from_directory("slate.fr")
+
+    assert len(first) == len(second) == 1
+    assert second[0][0] is not first[0][0]  # Fresh soup per call
+
+
 def test_abstract_class_cannot_be_instantiated():
     """Test that abstract base class cannot be instantiated directly."""
     with pytest.raises(TypeError):
@@ -4,10 +4,9 @@ Essential unit tests for BaseUrlCollector.
 Tests core behavior without overcomplexity.
 """
 
-from unittest.mock import Mock
-
 import pytest
 import requests
+from fixtures.helpers import MockSoupValidator, fake_response
 
 from core.components.url_collectors.base_url_collector import BaseUrlCollector
 
@@ -19,9 +18,9 @@ class MockUrlCollector(BaseUrlCollector):
         return ["https://test.com/article1", "https://test.com/article2"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def collector():
-    """Create a URL collector instance for testing."""
+    """URL collector shared by this module; tests only monkeypatch it per test."""
     return MockUrlCollector()
 
 
@@ -41,8 +40,7 @@ def test_initialization_with_debug(debug_value):
 
 def test_make_request_successful(collector, monkeypatch):
     """Test successful HTTP request."""
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
+    mock_response = fake_response()
 
     monkeypatch.setattr(collector, "make_request", lambda url, timeout: mock_response)
 
@@ -72,7 +70,7 @@ def test_make_request_handles_exception(collector, monkeypatch):
 
 def test_log_results_in_debug_mode(collector, monkeypatch):
     """Test that results are logged when debug is enabled."""
-    collector.debug = True
+    monkeypatch.setattr(collector, "debug", True)
     info_calls = []
     debug_calls = []
 
@@ -93,7 +91,7 @@ def test_log_results_in_debug_mode(collector, monkeypatch):
 
 def test_log_results_not_in_debug_mode(collector, monkeypatch):
     """Test that results are not logged when debug is disabled."""
-    collector.debug = False
+    monkeypatch.setattr(collector, "debug", False)
     info_calls = []
 
     monkeypatch.setattr(collector.logger, "info", lambda *args: info_calls.append(1))
@@ -139,3 +137,14 @@ def test_abstract_class_cannot_be_instantiated():
     """Test that abstract base class cannot be instantiated directly."""
     with pytest.raises(TypeError):
         BaseUrlCollector()  # type: ignore
+
+
+def test_session_shared_across_component_classes(collector):
+    """Test collectors and validators reuse one pooled HTTP session."""
+    validator = MockSoupValidator("test.com", "Test Site")
+
+    session = collector.get_session()
+
+    assert isinstance(session, requests.Session)
+    assert validator.get_session() is session
+    assert MockUrlCollector.get_session() is session
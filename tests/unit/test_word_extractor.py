@@ -11,15 +11,15 @@ from database.models import RawArticle, WordFact
 from services.word_extractor import WordExtractor
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor():
-    """WordExtractor instance for testing."""
+    """WordExtractor instance shared by this module (tests never mutate it)."""
     return WordExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_article():
-    """Sample article for testing."""
+    """Sample article shared read-only by this module's tests."""
     return RawArticle(
         url="https://test.fr/article",
         raw_html="<html><body><p>Test content</p></body></html>",